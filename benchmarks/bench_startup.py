@@ -0,0 +1,73 @@
+"""Import-time and construction-time benchmark for dbase.
+
+Usage::
+
+    python benchmarks/bench_startup.py [--runs 5] [--count 10000]
+
+Import cost is measured with ``python -X importtime -c "import dbase"`` in a
+fresh interpreter per run; construction cost is measured in-process for
+temporary and file-backed stores.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(runs: int) -> list:
+    results = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import dbase'],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        for line in proc.stderr.splitlines():
+            parts = [part.strip() for part in line.split('|')]
+            if len(parts) == 3 and parts[2] == 'dbase':
+                results.append(int(parts[1]))
+    return results
+
+
+def measure_construction(count: int) -> dict:
+    sys.path.insert(0, ROOT)
+    from dbase import DataBase
+
+    results = {}
+
+    start = time.perf_counter()
+    for _ in range(count):
+        DataBase(is_temp=True, show_logs=False)
+    results['temp'] = (time.perf_counter() - start) / count
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.json')
+        start = time.perf_counter()
+        for _ in range(count):
+            DataBase(file_path=path, show_logs=False).get_file().close()
+        results['file'] = (time.perf_counter() - start) / count
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--count', type=int, default=10000)
+    args = parser.parse_args()
+
+    imports = sorted(measure_import(args.runs))
+    print(f"import dbase (cumulative, -X importtime): "
+          f"min {imports[0]} us, median {imports[len(imports) // 2]} us")
+
+    for kind, seconds in measure_construction(args.count).items():
+        print(f"DataBase() construction [{kind}]: {seconds * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
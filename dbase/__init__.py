@@ -1,11 +1,11 @@
-import json
 import os
-from tempfile import NamedTemporaryFile
+import sys
+from _thread import allocate_lock
+from bisect import bisect_left
 
 
 # from .errors import *
 # from .security import *
-from .logger import Logger
 from .messages import get_message
 
 
@@ -13,11 +13,66 @@ __all__ = ['DataBase', 'Logger']
 __version__ = '3.0.1'
 
 
+_RESERVED_PREFIX = '__dbase_'
+_ESCAPE_KEY = '__dbase_escape__'
+_VERSIONS_KEY = '__dbase_versions__'
+_UNRECORDED_VERSION = '{"__dbase_unrecorded__":true}'
+_MISSING = object()
+
+_shared_logger = None
+_registry = None
+_registry_lock = allocate_lock()
+_opening_locks = {}
+
+
+def _get_logger():
+    global _shared_logger
+    if _shared_logger is None:
+        from .logger import Logger
+        _shared_logger = Logger()
+    return _shared_logger
+
+
+def __getattr__(name: str):
+    if name == 'Logger':
+        from .logger import Logger
+        return Logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _reuse_open(key: str, show_logs: bool):
+    db = _registry.get(key)
+    if db is None or db._closed:
+        return None
+
+    if show_logs is not None and show_logs != db._show_logs:
+        raise ValueError(get_message('open_show_logs_mismatch').format(path=key, show_logs=db._show_logs))
+    object.__setattr__(db, '_open_count', db._open_count + 1)
+    return db
+
+
+def _remove_temp_file(file, path: str) -> None:
+    import shutil
+
+    try:
+        if not file.closed:
+            file.close()
+        os.remove(path)
+    except OSError:
+        pass
+    for sidecar in ('.blobs', '.arrays'):
+        shutil.rmtree(path + sidecar, ignore_errors=True)
+
+
 class DataBase:
     __all__ = ['create', 'check_file_exists']
-    _BAN_NAMES = ('_file_path', '_show_logs', '_is_temp', '_file', 'logger')
+    _BAN_NAMES = ('_file_path', '_show_logs', '_is_temp', '_file', 'logger',
+                  '_spill_size', '_sizes', '_data_size', '_finalizer', '_closed', '_index',
+                  '_versions', '_blobs', '_blob_keys', '_arrays', '_array_keys',
+                  '_open_count', '_registry_key', '_raw_keys', '_load_failed', '_blob_refs')
 
-    def __init__(self, file_path: str = None, show_logs: bool = True, is_temp: bool = False):
+    def __init__(self, file_path: str = None, show_logs: bool = True, is_temp: bool = False,
+                 spill_size: int = None):
         if file_path is not None and not isinstance(file_path, str):
             raise TypeError(get_message('invalid_file_path_type'))
 
@@ -26,6 +81,10 @@ class DataBase:
 
         if not isinstance(is_temp, bool):
             raise TypeError(get_message('invalid_is_temp_type'))
+
+        if spill_size is not None and (
+                isinstance(spill_size, bool) or not isinstance(spill_size, int) or spill_size <= 0):
+            raise TypeError(get_message('invalid_spill_size_type'))
         
         if file_path is None and not is_temp:
             raise ValueError(get_message('file_path_required_for_non_temp'))
@@ -33,14 +92,75 @@ class DataBase:
         object.__setattr__(self, '_file_path', file_path)
         object.__setattr__(self, '_show_logs', show_logs)
         object.__setattr__(self, '_is_temp', is_temp)
-        object.__setattr__(self, 'logger', Logger())
         object.__setattr__(self, '_file', None)
+        object.__setattr__(self, '_spill_size', spill_size if is_temp else None)
+        object.__setattr__(self, '_sizes', {} if is_temp and spill_size else None)
+        object.__setattr__(self, '_data_size', 0)
+        object.__setattr__(self, '_finalizer', None)
+        object.__setattr__(self, '_closed', False)
+        object.__setattr__(self, '_index', [])
+        object.__setattr__(self, '_versions', None)
+        object.__setattr__(self, '_blobs', None)
+        object.__setattr__(self, '_blob_keys', {})
+        object.__setattr__(self, '_arrays', None)
+        object.__setattr__(self, '_array_keys', set())
+        object.__setattr__(self, '_open_count', 1)
+        object.__setattr__(self, '_registry_key', None)
+        object.__setattr__(self, '_raw_keys', set())
+        object.__setattr__(self, '_load_failed', False)
+        object.__setattr__(self, '_blob_refs', {})
         
         self.db_create_file()
         self._data_compliance_check()
 
 
+    @classmethod
+    def open(cls, file_path: str, show_logs: bool = None) -> 'DataBase':
+        global _registry
+
+        if not isinstance(file_path, str):
+            raise TypeError(get_message('invalid_file_path_type'))
+
+        if show_logs is not None and not isinstance(show_logs, bool):
+            raise TypeError(get_message('invalid_show_logs_type'))
+
+        key = os.path.realpath(file_path)
+        with _registry_lock:
+            if _registry is None:
+                import weakref
+                _registry = weakref.WeakValueDictionary()
+
+            db = _reuse_open(key, show_logs)
+            if db is not None:
+                return db
+            opening = _opening_locks.setdefault(key, allocate_lock())
+
+        with opening:
+            with _registry_lock:
+                db = _reuse_open(key, show_logs)
+            if db is not None:
+                return db
+
+            try:
+                db = cls(file_path=file_path, show_logs=True if show_logs is None else show_logs)
+                object.__setattr__(db, '_registry_key', key)
+                with _registry_lock:
+                    _registry[key] = db
+            finally:
+                with _registry_lock:
+                    if _opening_locks.get(key) is opening:
+                        del _opening_locks[key]
+            return db
+
+
+    @property
+    def logger(self):
+        return _get_logger()
+
+
     def _data_compliance_check(self) -> None:
+        import json
+
         if self._is_temp:
             for key in list(self.__dict__.keys()):
                 if key not in self._BAN_NAMES:
@@ -60,9 +180,19 @@ class DataBase:
             data = json.loads(content)
             
             if isinstance(data, dict):
+                if data.pop(_VERSIONS_KEY, False):
+                    self._get_versions()
+                values = {}
                 for key, value in data.items():
                     if key not in self._BAN_NAMES:
-                        object.__setattr__(self, key, value)
+                        value = self._decode_value(key, value)
+                        if key not in self._blob_keys:
+                            values[key] = value
+                self.__dict__.update(values)
+                object.__setattr__(self, '_index', sorted(key for key in data if self._is_data_key(key)))
+                if self._arrays is not None and self._arrays.rewritten:
+                    self._save_data()
+                    self._arrays.rewritten.clear()
             else:
                 self._log(get_message('invalid_data_format'), 'WARNING')
                 
@@ -70,9 +200,216 @@ class DataBase:
             self._log(get_message('json_decode_error'), 'ERROR')
             self._file.truncate(0)
         except Exception as e:
+            object.__setattr__(self, '_load_failed', True)
             self._log(f"{get_message('data_load_error')}: {str(e)}", 'ERROR')
 
 
+    def _ensure_writable(self) -> None:
+        if self._load_failed:
+            raise RuntimeError(get_message('store_load_failed').format(path=self._file_path))
+
+
+    def _is_data_key(self, name: str) -> bool:
+        return not name.startswith('_') and name not in self._BAN_NAMES
+
+
+    def _get_value(self, name: str):
+        digest = self._blob_keys.get(name)
+        if digest is not None:
+            return self._blobs.open(digest)
+        return self.__dict__[name]
+
+
+    def _set_value(self, name: str, value) -> None:
+        self._ensure_writable()
+        is_data_key = self._is_data_key(name)
+        values = None
+        if is_data_key and type(value).__module__ in ('array', 'numpy'):
+            from .arrays import to_array
+            values = to_array(value)
+
+        previous = self._blob_keys.pop(name, None)
+        if isinstance(value, (bytes, bytearray, memoryview)) and is_data_key:
+            digest = self._get_blobs().put(value)
+            self._retain_blob(digest)
+            self._blob_keys[name] = digest
+            self.__dict__.pop(name, None)
+        if previous is not None:
+            self._release_blob(previous)
+        self._raw_keys.discard(name)
+
+        if values is not None:
+            value = values
+            self._get_arrays().write(name, values)
+            self._array_keys.add(name)
+        elif name in self._array_keys:
+            self._array_keys.discard(name)
+            self._arrays.remove(name)
+
+        if name not in self._blob_keys:
+            object.__setattr__(self, name, value)
+        if self._is_data_key(name):
+            index = self._index
+            position = bisect_left(index, name)
+            if position == len(index) or index[position] != name:
+                index.insert(position, name)
+        self._track_size(name, value)
+        if self._versions is not None and self._versions.is_tracked(name):
+            self._record_version(name, value)
+
+
+    def _delete_value(self, name: str) -> None:
+        self._ensure_writable()
+        digest = self._blob_keys.pop(name, None)
+        if digest is None:
+            object.__delattr__(self, name)
+        else:
+            self._release_blob(digest)
+        self._raw_keys.discard(name)
+        if name in self._array_keys:
+            self._array_keys.discard(name)
+            self._arrays.remove(name)
+        index = self._index
+        position = bisect_left(index, name)
+        if position < len(index) and index[position] == name:
+            del index[position]
+        self._track_size(name, deleted=True)
+        if self._versions is not None and self._versions.is_tracked(name):
+            self._record_version(name, deleted=True)
+
+
+    def _get_blobs(self):
+        if self._blobs is None:
+            from .blobs import BlobStore
+            path = None if self._file is None else self._file_path + '.blobs'
+            object.__setattr__(self, '_blobs', BlobStore(path))
+        return self._blobs
+
+
+    def _retain_blob(self, digest: str) -> None:
+        self._blob_refs[digest] = self._blob_refs.get(digest, 0) + 1
+
+
+    def _release_blob(self, digest: str) -> None:
+        count = self._blob_refs.pop(digest, 1) - 1
+        if count:
+            self._blob_refs[digest] = count
+        else:
+            self._collect_blob(digest)
+
+
+    def _collect_blob(self, digest: str) -> None:
+        if digest in self._blob_refs:
+            return
+        if self._versions is not None and digest in self._versions.blob_refs:
+            return
+        self._get_blobs().remove(digest)
+
+
+    def _collect_released(self) -> None:
+        released = self._versions.released
+        while released:
+            self._collect_blob(released.pop())
+
+
+    def _get_arrays(self):
+        if self._arrays is None:
+            from .arrays import ArrayStore
+            path = None if self._file is None else self._file_path + '.arrays'
+            object.__setattr__(self, '_arrays', ArrayStore(path))
+        return self._arrays
+
+
+    def _encode_value(self, name: str, value, inline_arrays: bool = False):
+        digest = self._blob_keys.get(name)
+        if digest is not None:
+            from .blobs import BlobStore
+            return BlobStore.reference(digest)
+
+        if name in self._array_keys:
+            if inline_arrays:
+                return self._arrays.inline(value)
+            return self._arrays.reference(name, value)
+
+        if isinstance(value, dict) and len(value) == 1 and name not in self._raw_keys:
+            key = next(iter(value))
+            if isinstance(key, str) and key.startswith(_RESERVED_PREFIX):
+                return {_ESCAPE_KEY: value}
+        return value
+
+
+    def _decode_value(self, name: str, value):
+        if not isinstance(value, dict) or len(value) != 1:
+            return value
+
+        if _ESCAPE_KEY in value:
+            return value[_ESCAPE_KEY]
+
+        from .arrays import ArrayStore
+        if ArrayStore.is_reference(value):
+            try:
+                values = self._get_arrays().load(name, value)
+            except (OSError, KeyError, TypeError, ValueError):
+                self._log(get_message('array_load_error').format(name=name), 'ERROR')
+                if name is not None:
+                    self._raw_keys.add(name)
+                return value
+            if name is not None:
+                self._array_keys.add(name)
+            return values
+
+        from .blobs import BlobStore, BLOB_MARKER
+        if not BlobStore.is_reference(value):
+            return value
+
+        blobs = self._get_blobs()
+        digest = value[BLOB_MARKER]
+        if not blobs.exists(digest):
+            self._log(get_message('blob_not_found').format(digest=digest), 'ERROR')
+            if name is not None:
+                self._raw_keys.add(name)
+            return value
+
+        if name is None:
+            return blobs.open(digest)
+        self._retain_blob(digest)
+        self._blob_keys[name] = digest
+        return value
+
+
+    def _get_versions(self):
+        if self._versions is None:
+            from .versions import VersionHistory
+            path = None if self._is_temp else self._file_path + '.versions'
+            object.__setattr__(self, '_versions', VersionHistory(path))
+        return self._versions
+
+
+    def _record_version(self, name: str, value=None, deleted: bool = False) -> None:
+        import json
+
+        encoded = None
+        if not deleted:
+            try:
+                encoded = json.dumps(
+                    self._encode_value(name, value, inline_arrays=True),
+                    ensure_ascii=False, separators=(',', ':')
+                )
+            except (TypeError, ValueError):
+                self._log(get_message('version_not_serializable').format(name=name), 'WARNING')
+                encoded = _UNRECORDED_VERSION
+        self._versions.record(name, encoded)
+        self._collect_released()
+
+
+    def _decode_version(self, encoded: str):
+        if encoded == _UNRECORDED_VERSION:
+            return _MISSING
+
+        import json
+        return self._decode_value(None, json.loads(encoded))
+
+
     def _log(self, message: str, level: str = 'INFO') -> None:
         if not isinstance(level, str):
             raise TypeError(get_message('invalid_level_type'))
@@ -102,24 +439,101 @@ class DataBase:
 
     def db_create_file(self) -> None:
         if self._is_temp:
-            file = NamedTemporaryFile(mode='w+', delete=False, suffix='.json')
-            object.__setattr__(self, '_file', file)
-            object.__setattr__(self, '_file_path', file.name)
+            object.__setattr__(self, '_file_path', None)
             return
 
-        if self.check_file_exists(self._file_path):
-            try:
-                file = open(self._file_path, 'r+', encoding='utf-8')
-                object.__setattr__(self, '_file', file)
-            except Exception as e:
-                self._log(f"{get_message('file_open_error')}: {str(e)}", 'ERROR')
-                file = open(self._file_path, 'w+', encoding='utf-8')
-                object.__setattr__(self, '_file', file)
-        else:
+        try:
+            file = open(self._file_path, 'r+', encoding='utf-8')
+        except FileNotFoundError:
+            file = open(self._file_path, 'w+', encoding='utf-8')
+        except Exception as e:
+            self._log(f"{get_message('file_open_error')}: {str(e)}", 'ERROR')
             file = open(self._file_path, 'w+', encoding='utf-8')
-            object.__setattr__(self, '_file', file)
+        object.__setattr__(self, '_file', file)
     
 
+    def _spill(self) -> None:
+        import weakref
+        from tempfile import NamedTemporaryFile
+
+        file = NamedTemporaryFile(mode='w+', delete=False, suffix='.json', encoding='utf-8')
+        object.__setattr__(self, '_file', file)
+        object.__setattr__(self, '_file_path', file.name)
+        object.__setattr__(self, '_sizes', None)
+        object.__setattr__(self, '_finalizer', weakref.finalize(self, _remove_temp_file, file, file.name))
+
+        if self._blobs is not None:
+            blobs = self._blobs
+            object.__setattr__(self, '_blobs', None)
+            spilled = self._get_blobs()
+            for digest in blobs.digests():
+                spilled.put(blobs.open(digest))
+
+        if self._arrays is not None:
+            object.__setattr__(self, '_arrays', None)
+            arrays = self._get_arrays()
+            for key in self._array_keys:
+                arrays.write(key, self.__dict__[key])
+
+
+    def _track_size(self, name: str, value=None, deleted: bool = False) -> None:
+        if self._sizes is None or name.startswith('_'):
+            return
+
+        size = 0
+        if not deleted:
+            if isinstance(value, (bytes, bytearray, memoryview)):
+                size = len(name) + memoryview(value).nbytes
+            elif name in self._array_keys:
+                size = len(name) + len(value) * value.itemsize
+            else:
+                import json
+                try:
+                    size = len(name) + len(json.dumps(value, ensure_ascii=False))
+                except (TypeError, ValueError):
+                    pass
+
+        data_size = self._data_size + size - self._sizes.pop(name, 0)
+        if size:
+            self._sizes[name] = size
+        object.__setattr__(self, '_data_size', data_size)
+
+        if data_size > self._spill_size:
+            self._spill()
+
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        with _registry_lock:
+            object.__setattr__(self, '_open_count', self._open_count - 1)
+            if self._open_count > 0:
+                return
+            if self._registry_key is not None and _registry.get(self._registry_key) is self:
+                del _registry[self._registry_key]
+
+        if self._versions is not None:
+            self._versions.close()
+
+        if self._finalizer is not None:
+            self._finalizer()
+        else:
+            DataBase.flush(self)
+            if self._file and not self._file.closed:
+                self._file.close()
+        object.__setattr__(self, '_closed', True)
+
+
+    def flush(self) -> None:
+        if self._load_failed:
+            return
+
+        for key in self._array_keys:
+            self._arrays.sync(key, self.__dict__[key])
+        self._save_data()
+
+
     @staticmethod
     def check_file_exists(file_path: str) -> bool:
         if not isinstance(file_path, str):
@@ -132,25 +546,27 @@ class DataBase:
 
     
     def _save_data(self) -> None:
-        if self._file is None:
+        if self._file is None or self._load_failed:
             return
-            
-        data = {}
-        for key in dir(self):
-            if not key.startswith('_') and key not in self._BAN_NAMES:
+
+        import json
+
+        data = {key: self._encode_value(key, self.__dict__.get(key)) for key in self._index}
+        if self._versions is not None and self._versions.tracked():
+            data[_VERSIONS_KEY] = True
+        try:
+            content = json.dumps(data, indent=2, ensure_ascii=False)
+        except (TypeError, ValueError):
+            for key in list(data):
                 try:
-                    value = getattr(self, key)
-                    json.dumps(value)
-                    data[key] = value
-                except (TypeError, AttributeError):
-                    pass
-        
-        if not data:
-            return
+                    json.dumps(data[key])
+                except (TypeError, ValueError):
+                    del data[key]
+            content = json.dumps(data, indent=2, ensure_ascii=False)
 
         try:
             self._file.seek(0)
-            json.dump(data, self._file, indent=2, ensure_ascii=False)
+            self._file.write(content)
             self._file.truncate()
             self._file.flush()
         except Exception as e:
@@ -158,24 +574,10 @@ class DataBase:
 
 
     def __repr__(self) -> str:
-        data = {}
-        for key in dir(self):
-            if not key.startswith('_') and key not in self._BAN_NAMES:
-                try:
-                    data[key] = getattr(self, key)
-                except AttributeError:
-                    pass
-        return f"DataBase({data})"
+        return f"DataBase({dict(DataBase.items(self))})"
 
     def __str__(self) -> str:
-        data = {}
-        for key in dir(self):
-            if not key.startswith('_') and key not in self._BAN_NAMES:
-                try:
-                    data[key] = getattr(self, key)
-                except AttributeError:
-                    pass
-        return str(data)
+        return str(dict(DataBase.items(self)))
 
     def __bytes__(self) -> bytes:
         return str(self).encode('utf-8')
@@ -186,14 +588,8 @@ class DataBase:
         elif format_spec == 'repr':
             return repr(self)
         elif format_spec == 'json':
-            data = {}
-            for key in dir(self):
-                if not key.startswith('_') and key not in self._BAN_NAMES:
-                    try:
-                        data[key] = getattr(self, key)
-                    except AttributeError:
-                        pass
-            return json.dumps(data, ensure_ascii=False)
+            import json
+            return json.dumps(dict(DataBase.items(self)), ensure_ascii=False)
         else:
             return str(self).__format__(format_spec)
 
@@ -205,38 +601,34 @@ class DataBase:
         if name in self._BAN_NAMES:
             raise AttributeError(get_message('protected_attribute_deletion'))
 
-        if not hasattr(self, name):
+        if name not in self.__dict__ and name not in self._blob_keys:
             self._log(get_message('attribute_not_found').format(name=name), 'WARNING')
             return
         
-        super().__delattr__(name)
+        self._delete_value(name)
         self._save_data()
 
     def __setattr__(self, name: str, value) -> None:
         if not isinstance(name, str):
             raise TypeError(get_message('invalid_attribute_name'))
 
-        import inspect
-        
-        current_frame = inspect.currentframe()
-        
         is_from_class_method = False
-        if current_frame:
-            caller_frame = current_frame.f_back
-            if caller_frame:
-                method_name = caller_frame.f_code.co_name
-                caller_self = caller_frame.f_locals.get('self')
-                if caller_self is self and method_name != '__init__':
-                    is_from_class_method = True
+        caller_frame = sys._getframe(1)
+        if caller_frame:
+            method_name = caller_frame.f_code.co_name
+            caller_self = caller_frame.f_locals.get('self')
+            if caller_self is self and method_name != '__init__':
+                is_from_class_method = True
         
         if name in self._BAN_NAMES and hasattr(self, name) and not is_from_class_method:
             raise AttributeError(get_message('protected_attribute_modification'))
         
-        old_value = getattr(self, name, None) if name in self._BAN_NAMES else None
-        super().__setattr__(name, value)
-        
-        if name not in self._BAN_NAMES:
-            self._save_data()
+        if name in self._BAN_NAMES:
+            super().__setattr__(name, value)
+            return
+
+        self._set_value(name, value)
+        self._save_data()
 
 
     def __getattr__(self, name: str):
@@ -245,7 +637,10 @@ class DataBase:
 
         if name in self._BAN_NAMES or name.startswith('_'):
             raise AttributeError(get_message('attribute_not_found').format(name=name))
-        
+
+        digest = self._blob_keys.get(name)
+        if digest is not None:
+            return self._blobs.open(digest)
         return None
 
     def __getattribute__(self, name: str):
@@ -254,7 +649,7 @@ class DataBase:
 
     def __dir__(self) -> list[str]:
         public_attrs = []
-        for attr in super().__dir__():
+        for attr in list(super().__dir__()) + list(self._blob_keys):
             if not attr.startswith('_') and attr not in self._BAN_NAMES:
                 public_attrs.append(attr)
         return sorted(public_attrs)
@@ -267,7 +662,7 @@ class DataBase:
         if key in self._BAN_NAMES or key.startswith('_'):
             raise KeyError(get_message('protected_key_access'))
             
-        return getattr(self, key, None)
+        return DataBase.get(self, key)
 
     def __setitem__(self, key: str, value) -> None:
         if not isinstance(key, str):
@@ -288,53 +683,87 @@ class DataBase:
         return delattr(self, key)
 
     def __len__(self) -> int:
-        return len([attr for attr in dir(self) if not attr.startswith('_') and attr not in self._BAN_NAMES])
+        return len(self._index)
 
     def __contains__(self, item: str) -> bool:
         if not isinstance(item, str):
             raise TypeError(get_message('invalid_item_type'))
         
-        return hasattr(self, item) and item not in self._BAN_NAMES and not item.startswith('_')
+        index = self._index
+        position = bisect_left(index, item)
+        return position < len(index) and index[position] == item
 
 
     def __iter__(self):
-        keys = []
-        for key in dir(self):
-            if not key.startswith('_') and key not in self._BAN_NAMES:
-                keys.append(key)
-        return iter(keys)
+        return iter(list(self._index))
 
     def items(self):
-        items = []
-        for key in dir(self):
-            if not key.startswith('_') and key not in self._BAN_NAMES:
-                try:
-                    items.append((key, getattr(self, key)))
-                except AttributeError:
-                    pass
-        return items
+        return [(key, self._get_value(key)) for key in self._index]
 
     def keys(self):
-        return list(self.__iter__())
+        return list(self._index)
 
     def values(self):
-        values = []
-        for key in dir(self):
-            if not key.startswith('_') and key not in self._BAN_NAMES:
-                try:
-                    values.append(getattr(self, key))
-                except AttributeError:
-                    pass
-        return values
+        return [self._get_value(key) for key in self._index]
+
+    def scan(self, prefix: str = '') -> list:
+        if not isinstance(prefix, str):
+            raise TypeError(get_message('invalid_key_type'))
+
+        index = self._index
+        keys = []
+        for position in range(bisect_left(index, prefix), len(index)):
+            key = index[position]
+            if not key.startswith(prefix):
+                break
+            keys.append(key)
+        return keys
+
+    def range(self, start: str = None, end: str = None) -> list:
+        if (start is not None and not isinstance(start, str)) or (end is not None and not isinstance(end, str)):
+            raise TypeError(get_message('invalid_key_type'))
+
+        index = self._index
+        low = 0 if start is None else bisect_left(index, start)
+        high = len(index) if end is None else bisect_left(index, end)
+        return index[low:high]
+
+    def get_many(self, keys, default=None) -> dict:
+        return {key: DataBase.get(self, key, default) for key in keys}
+
+    def set_many(self, mapping: dict = None, **kwargs) -> None:
+        data = dict(mapping or {}, **kwargs)
+        for key in data:
+            if not isinstance(key, str):
+                raise TypeError(get_message('invalid_key_type'))
+            if not self._is_data_key(key):
+                raise KeyError(get_message('protected_key_modification'))
+
+        for key, value in data.items():
+            self._set_value(key, value)
+        self._save_data()
+
+    def delete_many(self, keys) -> None:
+        keys = list(keys)
+        for key in keys:
+            if not isinstance(key, str):
+                raise TypeError(get_message('invalid_key_type'))
+            if not self._is_data_key(key):
+                raise KeyError(get_message('protected_key_deletion'))
+
+        for key in keys:
+            if key in self:
+                self._delete_value(key)
+            else:
+                self._log(get_message('attribute_not_found').format(name=key), 'WARNING')
+        self._save_data()
 
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        self._save_data()
-        if self._file and not self._file.closed:
-            self._file.close()
+        DataBase.close(self)
 
 
     def __copy__(self):
@@ -342,14 +771,13 @@ class DataBase:
         new_db = DataBase(
             file_path=self._file_path,
             show_logs=self._show_logs,
-            is_temp=self._is_temp
+            is_temp=self._is_temp,
+            spill_size=self._spill_size
         )
-        for key in dir(self):
-            if not key.startswith('_') and key not in self._BAN_NAMES:
-                try:
-                    setattr(new_db, key, copy(getattr(self, key)))
-                except AttributeError:
-                    pass
+        DataBase.set_many(new_db, {
+            key: value if key in self._blob_keys else copy(value)
+            for key, value in DataBase.items(self)
+        })
         return new_db
 
     def __deepcopy__(self, memo):
@@ -357,26 +785,25 @@ class DataBase:
         new_db = DataBase(
             file_path=self._file_path,
             show_logs=self._show_logs,
-            is_temp=self._is_temp
+            is_temp=self._is_temp,
+            spill_size=self._spill_size
         )
-        for key in dir(self):
-            if not key.startswith('_') and key not in self._BAN_NAMES:
-                try:
-                    setattr(new_db, key, deepcopy(getattr(self, key), memo))
-                except AttributeError:
-                    pass
+        DataBase.set_many(new_db, {
+            key: value if key in self._blob_keys else deepcopy(value, memo)
+            for key, value in DataBase.items(self)
+        })
         return new_db
 
     def __hash__(self) -> int:
-        data_tuple = tuple(sorted(self.items()))
+        data_tuple = tuple(sorted(DataBase.items(self)))
         return hash(data_tuple)
 
 
     def __eq__(self, other) -> bool:
         if isinstance(other, DataBase):
-            return dict(self.items()) == dict(other.items())
+            return dict(DataBase.items(self)) == dict(DataBase.items(other))
         elif isinstance(other, dict):
-            return dict(self.items()) == other
+            return dict(DataBase.items(self)) == other
         return False
 
     def __ne__(self, other) -> bool:
@@ -385,8 +812,8 @@ class DataBase:
 
     def __bool__(self) -> bool:
         if self._is_temp:
-            return self._file is not None
-        return self.check_file_exists(self._file_path) if self._file_path else False
+            return not self._closed
+        return DataBase.check_file_exists(self._file_path) if self._file_path else False
 
 
     def __matmul__(self, other: str) -> None:
@@ -412,26 +839,137 @@ class DataBase:
         return bool(other) or bool(self)
 
     def clear(self) -> None:
-        for key in list(self.keys()):
-            delattr(self, key)
-        self._save_data()
+        DataBase.delete_many(self, DataBase.keys(self))
 
     def update(self, **kwargs) -> None:
-        for key, value in kwargs.items():
-            if key not in self._BAN_NAMES and not key.startswith('_'):
-                setattr(self, key, value)
-        self._save_data()
+        DataBase.set_many(self, {key: value for key, value in kwargs.items() if self._is_data_key(key)})
 
-    def get(self, key: str, default=None):
-        if key in self._BAN_NAMES or key.startswith('_'):
+    def get(self, key: str, default=None, version: int = None):
+        if version is not None:
+            if isinstance(version, bool) or not isinstance(version, int) or version <= 0:
+                raise TypeError(get_message('invalid_version_type'))
+            encoded = self._versions.get(key, version) if self._versions is not None else None
+            value = _MISSING if encoded is None else self._decode_version(encoded)
+            return default if value is _MISSING else value
+
+        if key not in self:
             return default
-        return getattr(self, key, default)
+        return self._get_value(key)
+
+    def track_versions(self, key: str, max_versions: int = None, max_age: float = None) -> None:
+        if not isinstance(key, str):
+            raise TypeError(get_message('invalid_key_type'))
+
+        if not self._is_data_key(key):
+            raise KeyError(get_message('protected_key_access'))
+
+        for limit, types in ((max_versions, int), (max_age, (int, float))):
+            if limit is not None and (isinstance(limit, bool) or not isinstance(limit, types) or limit <= 0):
+                raise TypeError(get_message('invalid_retention_type'))
+
+        self._ensure_writable()
+        versions = self._get_versions()
+        is_new = not versions.is_tracked(key)
+        versions.track(key, max_versions, max_age)
+        self._collect_released()
+        if is_new:
+            if key in self:
+                self._record_version(key, self._get_value(key))
+            self._save_data()
+
+    def append_array(self, key: str, values, typecode: str = 'd') -> None:
+        if not isinstance(key, str):
+            raise TypeError(get_message('invalid_key_type'))
+
+        if not self._is_data_key(key):
+            raise KeyError(get_message('protected_key_modification'))
+
+        from array import array
+        from .arrays import to_array
+
+        converted = to_array(values)
+        if key not in self:
+            self._set_value(key, array(typecode, values) if converted is None else converted)
+            self._save_data()
+            return
+
+        if key not in self._array_keys:
+            raise TypeError(get_message('not_an_array').format(name=key))
+
+        current = self._get_value(key)
+        current.extend(values if converted is None else converted)
+        self._track_size(key, current)
+        self._arrays.append(key, current)
+        if self._versions is not None and self._versions.is_tracked(key):
+            self._record_version(key, current)
+
+    def to_numpy(self, key: str):
+        if key not in self._array_keys:
+            raise TypeError(get_message('not_an_array').format(name=key))
+
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(get_message('numpy_required'))
+
+        values = self._get_value(key)
+        return numpy.frombuffer(values, dtype=values.typecode).copy()
+
+    def prune_blobs(self) -> int:
+        self._ensure_writable()
+        if self._blobs is None and (self._file is None or not os.path.isdir(self._file_path + '.blobs')):
+            return 0
+
+        import json
+        from .blobs import BlobStore, BLOB_MARKER
+
+        referenced = set(self._blob_keys.values())
+        if self._versions is not None:
+            for encoded in self._versions.encoded_values():
+                if BLOB_MARKER in encoded:
+                    value = json.loads(encoded)
+                    if BlobStore.is_reference(value):
+                        referenced.add(value[BLOB_MARKER])
+
+        blobs = self._get_blobs()
+        removed = 0
+        for digest in blobs.digests():
+            if digest not in referenced:
+                blobs.remove(digest)
+                removed += 1
+        return removed
+
+    def untrack_versions(self, key: str) -> None:
+        if self._versions is not None and self._versions.is_tracked(key):
+            self._ensure_writable()
+            self._versions.untrack(key)
+            self._collect_released()
+            self._save_data()
+
+    def versions(self, key: str) -> list:
+        if self._versions is None:
+            return []
+        return self._versions.versions(key)
+
+    def as_of(self, timestamp) -> dict:
+        if hasattr(timestamp, 'timestamp'):
+            timestamp = timestamp.timestamp()
+
+        snapshot = {}
+        if self._versions is None:
+            return snapshot
+
+        for key in self._versions.tracked():
+            encoded = self._versions.as_of(key, timestamp)
+            value = _MISSING if encoded is None else self._decode_version(encoded)
+            if value is not _MISSING:
+                snapshot[key] = value
+        return snapshot
 
     def pop(self, key: str, default=None):
-        if key in self._BAN_NAMES or key.startswith('_'):
+        if key not in self:
             return default
         
-        value = getattr(self, key, default)
-        if hasattr(self, key):
-            delattr(self, key)
+        value = self._get_value(key)
+        delattr(self, key)
         return value
@@ -0,0 +1,450 @@
+"""Offline maintenance tools for DBase store files.
+
+Every command streams the store one top-level entry at a time, so memory use
+is bounded by the largest value rather than by the size of the file.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from bisect import bisect_right
+
+from . import DataBase, _VERSIONS_KEY, __version__
+from .arrays import ArrayStore, ARRAY_MARKER
+from .blobs import BlobStore, BLOB_MARKER
+from .stream import StreamError, iter_items
+from .versions import parse_record
+
+
+_SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+def _format_size(size: float) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def _path_size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    total = 0
+    if os.path.isdir(path):
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    total += entry.stat().st_size
+    return total
+
+
+def _sidecars(path: str) -> dict:
+    return {name: f"{path}.{name}" for name in ('blobs', 'arrays', 'versions')}
+
+
+def _version_blob_digests(path: str) -> set:
+    digests = set()
+    if not os.path.isfile(path):
+        return digests
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if BLOB_MARKER not in line:
+                continue
+            try:
+                value = json.loads(json.loads(line)['d'])
+            except (ValueError, TypeError, KeyError):
+                continue
+            if BlobStore.is_reference(value):
+                digests.add(value[BLOB_MARKER])
+    return digests
+
+
+def _write_store(source: str, target, indent: int = None, chunk_size: int = 1 << 20) -> tuple:
+    separators = (',', ': ') if indent is not None else (',', ':')
+    newline = '\n' + ' ' * indent if indent is not None else ''
+
+    count = 0
+    digests = set()
+    array_files = set()
+
+    target.write('{')
+    for key, value, _ in iter_items(source, chunk_size):
+        if BlobStore.is_reference(value):
+            digests.add(value[BLOB_MARKER])
+        elif ArrayStore.is_reference(value) and 'file' in value[ARRAY_MARKER]:
+            array_files.add(value[ARRAY_MARKER]['file'])
+
+        encoded = json.dumps(value, indent=indent, ensure_ascii=False, separators=separators)
+        target.write(
+            (',' if count else '') + newline
+            + json.dumps(key, ensure_ascii=False) + separators[1]
+            + encoded.replace('\n', newline)
+        )
+        count += 1
+    target.write(('\n' if indent is not None and count else '') + '}')
+
+    return count, digests, array_files
+
+
+def _rewrite(source: str, target_path: str, indent: int, chunk_size: int) -> tuple:
+    directory = os.path.dirname(os.path.abspath(target_path))
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as target:
+            result = _write_store(source, target, indent, chunk_size)
+        shutil.copymode(target_path if os.path.exists(target_path) else source, temp_path)
+        os.replace(temp_path, target_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return result
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    import heapq
+
+    count = 0
+    total = 0
+    blobs = 0
+    arrays = 0
+    buckets = [0] * (len(_SIZE_BUCKETS) + 1)
+    largest = []
+
+    for key, value, size in iter_items(args.path, args.chunk_size):
+        count += 1
+        total += size
+        buckets[bisect_right(_SIZE_BUCKETS, size)] += 1
+        if len(largest) < args.top:
+            heapq.heappush(largest, (size, key))
+        elif size > largest[0][0]:
+            heapq.heapreplace(largest, (size, key))
+
+        if BlobStore.is_reference(value):
+            blobs += 1
+        elif ArrayStore.is_reference(value):
+            arrays += 1
+
+    sidecars = {name: _path_size(path) for name, path in _sidecars(args.path).items()}
+    largest = sorted(largest, reverse=True)
+
+    if args.json:
+        print(json.dumps({
+            'path': args.path,
+            'file_size': os.path.getsize(args.path),
+            'keys': count,
+            'value_bytes': total,
+            'blob_values': blobs,
+            'array_values': arrays,
+            'sidecars': sidecars,
+            'size_distribution': {
+                (f"<{bound}" if index < len(_SIZE_BUCKETS) else f">={_SIZE_BUCKETS[-1]}"): buckets[index]
+                for index, bound in enumerate(_SIZE_BUCKETS + (None,))
+            },
+            'largest': [{'key': key, 'size': size} for size, key in largest]
+        }, ensure_ascii=False, indent=2))
+        return 0
+
+    print(f"File:          {args.path} ({_format_size(os.path.getsize(args.path))})")
+    print(f"Keys:          {count}")
+    print(f"Value bytes:   {_format_size(total)}")
+    print(f"Blob values:   {blobs}")
+    print(f"Array values:  {arrays}")
+    for name, size in sidecars.items():
+        if size:
+            print(f"{name.capitalize() + ':':<14} {_format_size(size)}")
+
+    print("\nSize distribution:")
+    lower = 0
+    for index, number in enumerate(buckets):
+        label = (f"{_format_size(lower)} - {_format_size(_SIZE_BUCKETS[index])}"
+                 if index < len(_SIZE_BUCKETS) else f">= {_format_size(_SIZE_BUCKETS[-1])}")
+        print(f"  {label:<22} {number}")
+        if index < len(_SIZE_BUCKETS):
+            lower = _SIZE_BUCKETS[index]
+
+    if largest:
+        print(f"\nLargest {len(largest)} keys:")
+        for size, key in largest:
+            print(f"  {_format_size(size):>10}  {key}")
+    return 0
+
+
+def _verify_blob(blobs_path: str, digest: str, deep: bool) -> str:
+    import hashlib
+
+    blob_path = os.path.join(blobs_path, digest)
+    if not os.path.isfile(blob_path):
+        return f"missing blob {digest}"
+
+    if deep:
+        hasher = hashlib.sha256()
+        with open(blob_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+        if hasher.hexdigest() != digest:
+            return f"blob {digest} does not match its digest"
+    return None
+
+
+def _verify_array(arrays_path: str, payload: dict) -> str:
+    from array import array
+
+    try:
+        itemsize = array(payload['typecode']).itemsize
+    except (KeyError, TypeError, ValueError):
+        return f"invalid array typecode {payload.get('typecode')!r}"
+
+    if 'items' in payload:
+        return None
+
+    array_path = os.path.join(arrays_path, str(payload.get('file')))
+    if not os.path.isfile(array_path):
+        return f"missing array file {payload.get('file')}"
+
+    size = os.path.getsize(array_path)
+    if size % itemsize:
+        return f"array file {payload['file']} has a truncated trailing item ({size % itemsize} extra bytes)"
+    return None
+
+
+def cmd_verify(args: argparse.Namespace) -> int:
+    sidecars = _sidecars(args.path)
+    problems = []
+    warnings = []
+    seen = set()
+    count = 0
+
+    try:
+        for key, value, _ in iter_items(args.path, args.chunk_size):
+            count += 1
+            if key in seen:
+                warnings.append(f"duplicate key {key!r}; the last value wins when loading")
+            seen.add(key)
+
+            if key == _VERSIONS_KEY:
+                continue
+            if key.startswith('_') or key in DataBase._BAN_NAMES:
+                warnings.append(f"reserved key {key!r} is ignored when loading")
+
+            problem = None
+            if BlobStore.is_reference(value):
+                problem = _verify_blob(sidecars['blobs'], value[BLOB_MARKER], args.deep)
+            elif ArrayStore.is_reference(value):
+                problem = _verify_array(sidecars['arrays'], value[ARRAY_MARKER])
+            if problem:
+                problems.append(f"{key!r}: {problem}")
+    except StreamError as e:
+        problems.append(f"invalid JSON: {e}")
+    except UnicodeDecodeError as e:
+        problems.append(f"invalid UTF-8 ({e.reason})")
+
+    if os.path.isfile(sidecars['versions']):
+        with open(sidecars['versions'], 'r', encoding='utf-8', errors='replace') as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    parse_record(line)
+                except (ValueError, TypeError, KeyError):
+                    warnings.append(f"version log line {number} is unreadable and is ignored when loading")
+
+        for digest in _version_blob_digests(sidecars['versions']):
+            problem = _verify_blob(sidecars['blobs'], digest, args.deep)
+            if problem:
+                problems.append(f"version history: {problem}")
+
+    for message in warnings:
+        print(f"WARNING: {message}")
+    for message in problems:
+        print(f"ERROR: {message}")
+
+    status = 'FAILED' if problems else 'OK'
+    print(f"{status}: {count} keys checked, {len(problems)} errors, {len(warnings)} warnings")
+    return 1 if problems else 0
+
+
+def _prune_sidecars(path: str, digests: set, array_files: set) -> tuple:
+    sidecars = _sidecars(path)
+    digests = digests | _version_blob_digests(sidecars['versions'])
+    removed_blobs = 0
+    removed_arrays = 0
+
+    for digest in BlobStore(sidecars['blobs']).digests():
+        if digest not in digests:
+            os.remove(os.path.join(sidecars['blobs'], digest))
+            removed_blobs += 1
+
+    if os.path.isdir(sidecars['arrays']):
+        for name in os.listdir(sidecars['arrays']):
+            if name.endswith('.bin') and name not in array_files:
+                os.remove(os.path.join(sidecars['arrays'], name))
+                removed_arrays += 1
+
+    return removed_blobs, removed_arrays
+
+
+def cmd_compact(args: argparse.Namespace) -> int:
+    before = os.path.getsize(args.path)
+    count, digests, array_files = _rewrite(args.path, args.path, args.indent, args.chunk_size)
+    after = os.path.getsize(args.path)
+    print(f"Rewrote {count} keys: {_format_size(before)} -> {_format_size(after)}")
+
+    if args.prune:
+        removed_blobs, removed_arrays = _prune_sidecars(args.path, digests, array_files)
+        print(f"Removed {removed_blobs} unreferenced blobs and {removed_arrays} unreferenced array files")
+    return 0
+
+
+def cmd_convert(args: argparse.Namespace) -> int:
+    if os.path.realpath(args.source) == os.path.realpath(args.target):
+        print(f"ERROR: {args.target} is the source store (use compact to rewrite a store in place)", file=sys.stderr)
+        return 1
+
+    if os.path.exists(args.target) and not args.force:
+        print(f"ERROR: {args.target} already exists (use --force to overwrite)", file=sys.stderr)
+        return 1
+
+    count, digests, array_files = _rewrite(args.source, args.target, args.indent, args.chunk_size)
+    source = _sidecars(args.source)
+    target = _sidecars(args.target)
+
+    for name, path in target.items():
+        if name == 'versions':
+            if os.path.isfile(path):
+                os.remove(path)
+        else:
+            shutil.rmtree(path, ignore_errors=True)
+
+    if os.path.isfile(source['versions']):
+        shutil.copyfile(source['versions'], target['versions'])
+        digests |= _version_blob_digests(source['versions'])
+
+    for name, files in (('blobs', digests), ('arrays', array_files)):
+        for file_name in files:
+            source_file = os.path.join(source[name], file_name)
+            if os.path.isfile(source_file):
+                os.makedirs(target[name], exist_ok=True)
+                shutil.copyfile(source_file, os.path.join(target[name], file_name))
+
+    print(f"Wrote {count} keys to {args.target} ({_format_size(os.path.getsize(args.target))}), "
+          f"{len(digests)} blobs, {len(array_files)} array files")
+    return 0
+
+
+def _copy_store(source: str, target: str) -> None:
+    shutil.copyfile(source, target)
+    for name, path in _sidecars(source).items():
+        if os.path.isdir(path):
+            shutil.copytree(path, f"{target}.{name}")
+        elif os.path.isfile(path):
+            shutil.copyfile(path, f"{target}.{name}")
+
+
+def _rate(operations: int, seconds: float) -> str:
+    return f"{operations / seconds:,.0f} ops/s" if seconds > 0 else 'n/a'
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    import random
+
+    generator = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, os.path.basename(args.path))
+        _copy_store(args.path, path)
+
+        start = time.perf_counter()
+        db = DataBase(file_path=path, show_logs=False)
+        load = time.perf_counter() - start
+
+        keys = db.keys()
+        print(f"Load:          {load * 1000:.1f} ms ({len(keys)} keys, {_format_size(os.path.getsize(path))})")
+
+        if keys:
+            sample = [generator.choice(keys) for _ in range(args.reads)]
+            start = time.perf_counter()
+            for key in sample:
+                db.get(key)
+            print(f"Reads:         {_rate(args.reads, time.perf_counter() - start)}")
+
+            prefixes = [key[:3] for key in sample[:args.scans]]
+            start = time.perf_counter()
+            for prefix in prefixes:
+                db.scan(prefix)
+            print(f"Prefix scans:  {_rate(len(prefixes), time.perf_counter() - start)}")
+
+        start = time.perf_counter()
+        for number in range(args.writes):
+            db['dbase_bench_key'] = number
+        print(f"Writes:        {_rate(args.writes, time.perf_counter() - start)}")
+
+        start = time.perf_counter()
+        db.close()
+        print(f"Close:         {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m dbase', description=__doc__.splitlines()[0])
+    parser.add_argument('--version', action='version', version=f"dbase {__version__}")
+    parser.add_argument('--chunk-size', type=int, default=1 << 20, help='read buffer size in characters')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    stats = commands.add_parser('stats', help='key count, size distribution and largest keys')
+    stats.add_argument('path')
+    stats.add_argument('--top', type=int, default=10, help='number of largest keys to show')
+    stats.add_argument('--json', action='store_true', help='print machine-readable JSON')
+    stats.set_defaults(handler=cmd_stats)
+
+    verify = commands.add_parser('verify', help='non-destructive integrity check')
+    verify.add_argument('path')
+    verify.add_argument('--deep', action='store_true', help='re-hash blob contents')
+    verify.set_defaults(handler=cmd_verify)
+
+    compact = commands.add_parser('compact', help='rewrite a store in place (it must not be open elsewhere)')
+    compact.add_argument('path')
+    compact.add_argument('--indent', type=int, default=None, help='indent width (default: no whitespace)')
+    compact.add_argument('--prune', action='store_true', help='remove unreferenced blob and array files')
+    compact.set_defaults(handler=cmd_compact)
+
+    convert = commands.add_parser('convert', help='write a copy of a store with another layout')
+    convert.add_argument('source')
+    convert.add_argument('target')
+    convert.add_argument('--indent', type=int, default=None, help='indent width (default: no whitespace)')
+    convert.add_argument('--force', action='store_true', help='overwrite an existing target')
+    convert.set_defaults(handler=cmd_convert)
+
+    bench = commands.add_parser('bench', help='run the built-in workload against a copy of a store')
+    bench.add_argument('path')
+    bench.add_argument('--reads', type=int, default=10000)
+    bench.add_argument('--scans', type=int, default=1000)
+    bench.add_argument('--writes', type=int, default=100)
+    bench.add_argument('--seed', type=int, default=0)
+    bench.set_defaults(handler=cmd_bench)
+
+    return parser
+
+
+def main(argv: list = None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    if not os.path.isfile(getattr(args, 'path', None) or getattr(args, 'source', '')):
+        print(f"ERROR: no such file: {getattr(args, 'path', None) or args.source}", file=sys.stderr)
+        return 1
+
+    try:
+        return args.handler(args)
+    except StreamError as e:
+        print(f"ERROR: invalid JSON: {e}", file=sys.stderr)
+        return 1
+    except UnicodeDecodeError as e:
+        print(f"ERROR: invalid UTF-8 ({e.reason})", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,2 @@
-import shutil
 import os
 import time
-import json
-import ast
-from typing import Dict, Any
-from datetime import datetime
-from tempfile import NamedTemporaryFile
-
-from .ansii_escape_codes import color
\ No newline at end of file
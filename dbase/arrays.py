@@ -0,0 +1,144 @@
+import sys
+from array import array
+
+from ._imports import *
+from .messages import get_message
+
+
+__all__ = ['ArrayStore', 'ARRAY_MARKER', 'to_array']
+
+
+ARRAY_MARKER = '__dbase_array__'
+_NUMPY_TYPECODES = frozenset('bBhHiIlLqQfd')
+
+
+def to_array(value):
+    if isinstance(value, array):
+        return value
+
+    if type(value).__module__ != 'numpy' or not getattr(value, 'ndim', 0):
+        return None
+
+    if value.ndim != 1 or value.dtype.char not in _NUMPY_TYPECODES:
+        raise TypeError(get_message('unsupported_array').format(dtype=value.dtype, ndim=value.ndim))
+    value = value.astype(value.dtype.newbyteorder('='), copy=False)
+    return array(value.dtype.char, value.tobytes())
+
+
+class ArrayStore:
+    """Packed binary storage for ``array.array`` values.
+
+    Each key is kept in ``<path>/<sha1 of key>.bin`` as raw machine values.
+    The size and CRC-32 of what is on disk are remembered per key: ``append``
+    only writes the new tail, and ``sync`` checks the whole array so in-place
+    edits and shrinks are rewritten.
+    With ``path=None`` arrays are encoded inline in the JSON document instead.
+    Keys whose files were converted to native byte order on load are collected
+    in ``rewritten`` until their references have been saved.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.rewritten = set()
+        self._persisted = {}
+
+    @staticmethod
+    def is_reference(value) -> bool:
+        return isinstance(value, dict) and len(value) == 1 and isinstance(value.get(ARRAY_MARKER), dict)
+
+    @staticmethod
+    def inline(values: array) -> dict:
+        return {ARRAY_MARKER: {'typecode': values.typecode, 'items': values.tolist()}}
+
+    @staticmethod
+    def file_name(key: str) -> str:
+        import hashlib
+        return hashlib.sha1(key.encode('utf-8')).hexdigest() + '.bin'
+
+    def reference(self, key: str, values: array) -> dict:
+        if self.path is None:
+            return self.inline(values)
+        return {ARRAY_MARKER: {
+            'typecode': values.typecode,
+            'file': self.file_name(key),
+            'byteorder': sys.byteorder
+        }}
+
+    def load(self, key: str, value: dict) -> array:
+        payload = value[ARRAY_MARKER]
+        if 'items' in payload:
+            return array(payload['typecode'], payload['items'])
+
+        values = array(payload['typecode'])
+        with open(os.path.join(self.path, payload['file']), 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            values.fromfile(f, size // values.itemsize)
+        if payload.get('byteorder', sys.byteorder) != sys.byteorder:
+            values.byteswap()
+            self.write(key, values)
+            self.rewritten.add(key)
+        else:
+            self._remember(key, values)
+        return values
+
+    def _remember(self, key: str, values: array) -> None:
+        import zlib
+
+        with memoryview(values) as view:
+            self._persisted[key] = (view.nbytes, zlib.crc32(view))
+
+    def write(self, key: str, values: array) -> None:
+        if self.path is None:
+            return
+
+        os.makedirs(self.path, exist_ok=True)
+        file_path = os.path.join(self.path, self.file_name(key))
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            values.tofile(f)
+        os.replace(temp_path, file_path)
+        self._remember(key, values)
+
+    def append(self, key: str, values: array) -> None:
+        if self.path is None:
+            return
+
+        import zlib
+
+        persisted = self._persisted.get(key)
+        with memoryview(values) as raw, raw.cast('B') as view:
+            if persisted is not None and persisted[0] <= view.nbytes:
+                size, checksum = persisted
+                if size < view.nbytes:
+                    with open(os.path.join(self.path, self.file_name(key)), 'ab') as f:
+                        f.truncate(size)
+                        f.write(view[size:])
+                    self._persisted[key] = (view.nbytes, zlib.crc32(view[size:], checksum))
+                return
+        self.write(key, values)
+
+    def sync(self, key: str, values: array) -> None:
+        if self.path is None:
+            return
+
+        import zlib
+
+        persisted = self._persisted.get(key)
+        if persisted is not None:
+            size, checksum = persisted
+            with memoryview(values) as raw, raw.cast('B') as view:
+                unchanged = size <= view.nbytes and zlib.crc32(view[:size]) == checksum
+            if unchanged:
+                self.append(key, values)
+                return
+        self.write(key, values)
+
+    def remove(self, key: str) -> None:
+        self._persisted.pop(key, None)
+        if self.path is None:
+            return
+
+        try:
+            os.remove(os.path.join(self.path, self.file_name(key)))
+        except OSError:
+            pass
@@ -0,0 +1,90 @@
+from ._imports import *
+
+
+__all__ = ['BlobStore', 'BLOB_MARKER']
+
+
+BLOB_MARKER = '__dbase_blob__'
+
+
+class BlobStore:
+    """Content-addressed storage for binary values.
+
+    Blobs are kept as ``<path>/<sha256>`` files and read back as read-only
+    ``memoryview`` objects over ``mmap``; with ``path=None`` they stay in memory.
+    Each read maps the file afresh and the mapping is released with the view,
+    so no descriptors are held for blobs nobody is looking at. Only the raw
+    bytes are stored: typed or multi-dimensional views read back as flat
+    unsigned-byte (format ``'B'``) views.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self._data = {}
+
+    @staticmethod
+    def is_reference(value) -> bool:
+        return isinstance(value, dict) and len(value) == 1 and isinstance(value.get(BLOB_MARKER), str)
+
+    @staticmethod
+    def reference(digest: str) -> dict:
+        return {BLOB_MARKER: digest}
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.path, digest)
+
+    def put(self, data) -> str:
+        import hashlib
+
+        data = memoryview(data)
+        if not data.c_contiguous:
+            data = memoryview(data.tobytes())
+        data = data.cast('B')
+
+        digest = hashlib.sha256(data).hexdigest()
+        if self.path is None:
+            if digest not in self._data:
+                self._data[digest] = bytes(data)
+            return digest
+
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            os.makedirs(self.path, exist_ok=True)
+            temp_path = f"{blob_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, blob_path)
+        return digest
+
+    def exists(self, digest: str) -> bool:
+        if self.path is None:
+            return digest in self._data
+        return os.path.isfile(self._blob_path(digest))
+
+    def open(self, digest: str) -> memoryview:
+        if self.path is None:
+            return memoryview(self._data[digest])
+
+        import mmap
+
+        with open(self._blob_path(digest), 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b'')
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def digests(self) -> list:
+        if self.path is None:
+            return list(self._data)
+        if not os.path.isdir(self.path):
+            return []
+        return [name for name in os.listdir(self.path) if len(name) == 64 and '.' not in name]
+
+    def remove(self, digest: str) -> None:
+        if self.path is None:
+            self._data.pop(digest, None)
+            return
+
+        try:
+            os.remove(self._blob_path(digest))
+        except OSError:
+            pass
@@ -1,6 +1,7 @@
 __all__ = ['Logger']
 
 from ._imports import *
+from .ansii_escape_codes import color
 
 class Logger:
     def __init__(self, title: str = 'DBASE', /, log_file: str = None, log_format: str = None, time_format: str = "%Y-%m-%d %H:%M:%S"):
@@ -7,16 +7,21 @@ __all__ = ['get_message', 'set_language', 'get_available_languages']
 class _MessageManager:
     
     _instance = None
-    _messages: Dict[str, Dict[str, str]] = {}
+    _messages: dict = None
     _current_language: str = 'eng'
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._load_messages()
         return cls._instance
     
+    def _ensure_loaded(self) -> None:
+        if self._messages is None:
+            self._load_messages()
+    
     def _load_messages(self) -> None:
+        import json
+
         try:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             messages_file = os.path.join(current_dir, 'messages.json')
@@ -51,7 +56,18 @@ class _MessageManager:
                     'invalid_item_type': 'Item must be a string',
                     'invalid_docstring_type': 'Docstring must be a string',
                     'language_not_supported': 'Language not supported',
-                    'message_not_found': 'Message not found'
+                    'message_not_found': 'Message not found',
+                    'invalid_spill_size_type': 'Spill size must be a positive integer or None',
+                    'invalid_retention_type': 'Retention limits must be positive numbers or None',
+                    'invalid_version_type': 'Version must be a positive integer',
+                    'blob_not_found': 'Blob not found: {digest}',
+                    'not_an_array': 'Value is not an array: {name}',
+                    'numpy_required': 'NumPy is required for this operation',
+                    'array_load_error': 'Error loading array: {name}',
+                    'version_not_serializable': 'Value of tracked key {name} is not JSON-serializable; its version is recorded without a value',
+                    'store_load_failed': 'The store could not be loaded; writes are disabled to protect {path}',
+                    'open_show_logs_mismatch': '{path} is already open with show_logs={show_logs}',
+                    'unsupported_array': 'Only one-dimensional arrays with a dtype supported by array.array can be stored, got dtype {dtype} with {ndim} dimensions'
                 },
                 'ru': {
                     'test': 'тест!',
@@ -77,7 +93,18 @@ class _MessageManager:
                     'invalid_item_type': 'Элемент должен быть строкой',
                     'invalid_docstring_type': 'Строка документации должна быть строкой',
                     'language_not_supported': 'Язык не поддерживается',
-                    'message_not_found': 'Сообщение не найдено'
+                    'message_not_found': 'Сообщение не найдено',
+                    'invalid_spill_size_type': 'Параметр spill_size должен быть положительным целым числом или None',
+                    'invalid_retention_type': 'Ограничения хранения должны быть положительными числами или None',
+                    'invalid_version_type': 'Версия должна быть положительным целым числом',
+                    'blob_not_found': 'Блоб не найден: {digest}',
+                    'not_an_array': 'Значение не является массивом: {name}',
+                    'numpy_required': 'Для этой операции требуется NumPy',
+                    'array_load_error': 'Ошибка загрузки массива: {name}',
+                    'version_not_serializable': 'Значение отслеживаемого ключа {name} не сериализуется в JSON; версия записана без значения',
+                    'store_load_failed': 'Не удалось загрузить хранилище; запись отключена для защиты {path}',
+                    'open_show_logs_mismatch': '{path} уже открыт с show_logs={show_logs}',
+                    'unsupported_array': 'Можно сохранять только одномерные массивы с типом, поддерживаемым array.array, получен dtype {dtype} с {ndim} измерениями'
                 }
             }
             
@@ -115,7 +142,18 @@ class _MessageManager:
                     'invalid_item_type': 'Item must be a string',
                     'invalid_docstring_type': 'Docstring must be a string',
                     'language_not_supported': 'Language not supported',
-                    'message_not_found': 'Message not found'
+                    'message_not_found': 'Message not found',
+                    'invalid_spill_size_type': 'Spill size must be a positive integer or None',
+                    'invalid_retention_type': 'Retention limits must be positive numbers or None',
+                    'invalid_version_type': 'Version must be a positive integer',
+                    'blob_not_found': 'Blob not found: {digest}',
+                    'not_an_array': 'Value is not an array: {name}',
+                    'numpy_required': 'NumPy is required for this operation',
+                    'array_load_error': 'Error loading array: {name}',
+                    'version_not_serializable': 'Value of tracked key {name} is not JSON-serializable; its version is recorded without a value',
+                    'store_load_failed': 'The store could not be loaded; writes are disabled to protect {path}',
+                    'open_show_logs_mismatch': '{path} is already open with show_logs={show_logs}',
+                    'unsupported_array': 'Only one-dimensional arrays with a dtype supported by array.array can be stored, got dtype {dtype} with {ndim} dimensions'
                 },
                 'ru': {
                     'test': 'тест!',
@@ -141,7 +179,18 @@ class _MessageManager:
                     'invalid_item_type': 'Элемент должен быть строкой',
                     'invalid_docstring_type': 'Строка документации должна быть строкой',
                     'language_not_supported': 'Язык не поддерживается',
-                    'message_not_found': 'Сообщение не найдено'
+                    'message_not_found': 'Сообщение не найдено',
+                    'invalid_spill_size_type': 'Параметр spill_size должен быть положительным целым числом или None',
+                    'invalid_retention_type': 'Ограничения хранения должны быть положительными числами или None',
+                    'invalid_version_type': 'Версия должна быть положительным целым числом',
+                    'blob_not_found': 'Блоб не найден: {digest}',
+                    'not_an_array': 'Значение не является массивом: {name}',
+                    'numpy_required': 'Для этой операции требуется NumPy',
+                    'array_load_error': 'Ошибка загрузки массива: {name}',
+                    'version_not_serializable': 'Значение отслеживаемого ключа {name} не сериализуется в JSON; версия записана без значения',
+                    'store_load_failed': 'Не удалось загрузить хранилище; запись отключена для защиты {path}',
+                    'open_show_logs_mismatch': '{path} уже открыт с show_logs={show_logs}',
+                    'unsupported_array': 'Можно сохранять только одномерные массивы с типом, поддерживаемым array.array, получен dtype {dtype} с {ndim} измерениями'
                 }
             }
         except json.JSONDecodeError as e:
@@ -152,6 +201,8 @@ class _MessageManager:
     def get(self, message_title: str, language: str = None) -> str:
         if not isinstance(message_title, str):
             raise ValueError("message_title must be a string")
+        
+        self._ensure_loaded()
             
         if language is None:
             language = self._current_language
@@ -182,12 +233,14 @@ class _MessageManager:
         return message_title
     
     def set_language(self, language: str) -> None:
+        self._ensure_loaded()
         if language not in self._messages:
             raise ValueError(f"Language '{language}' not supported. "
                            f"Available: {list(self._messages.keys())}")
         self._current_language = language
     
     def get_available_languages(self) -> list:
+        self._ensure_loaded()
         return list(self._messages.keys())
 
 
@@ -0,0 +1,117 @@
+import json
+
+from ._imports import *
+
+
+__all__ = ['StreamError', 'iter_items']
+
+
+class StreamError(ValueError):
+    def __init__(self, message: str, offset: int):
+        super().__init__(f"{message} (offset {offset})")
+        self.offset = offset
+
+
+class _ObjectReader:
+    """Incremental reader for a top-level JSON object.
+
+    Only the current key/value pair is held in memory, so memory use is
+    bounded by the largest value rather than the size of the file.
+    """
+
+    _WHITESPACE = ' \t\n\r'
+
+    def __init__(self, file, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size: int = None) -> bool:
+        if self.eof:
+            return False
+
+        chunk = self.file.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, message: str, pos: int = None) -> StreamError:
+        return StreamError(message, self.offset + (self.pos if pos is None else pos))
+
+    def _peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in self._WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise self._error(f"Expected one of {chars!r}, found {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def _delimited(self, end: int) -> bool:
+        for char in self.buffer[end:end + 3]:
+            if char in self._WHITESPACE or char in ',}]':
+                return True
+        return False
+
+    def _decode(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                truncated = e.pos >= len(self.buffer) - 8 or e.msg.startswith('Unterminated string')
+                if not truncated or not self._fill(max(self.chunk_size, len(self.buffer) - self.pos)):
+                    raise self._error(e.msg, e.pos)
+                continue
+
+            if not self.eof and not isinstance(value, (str, dict, list)) and not self._delimited(end):
+                self._fill()
+                continue
+
+            start = self.pos
+            self.pos = end
+            return value, end - start
+
+    def items(self):
+        if not self._peek():
+            return
+
+        self._expect('{')
+        if self._peek() == '}':
+            self.pos += 1
+        else:
+            while True:
+                key_offset = self.offset + self.pos
+                key, _ = self._decode()
+                if not isinstance(key, str):
+                    raise StreamError('Expected a string key', key_offset)
+                self._expect(':')
+                value, size = self._decode()
+                yield key, value, size
+                if self._expect(',}') == '}':
+                    break
+
+        if self._peek():
+            raise self._error('Unexpected data after the end of the object')
+
+
+def iter_items(file_path: str, chunk_size: int = 1 << 20):
+    """Yield ``(key, value, encoded_size)`` for each top-level entry of a store file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        yield from _ObjectReader(f, chunk_size).items()
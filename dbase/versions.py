@@ -0,0 +1,260 @@
+from ._imports import *
+from .blobs import BlobStore, BLOB_MARKER
+
+
+__all__ = ['VersionHistory', 'parse_record']
+
+
+def parse_record(line) -> dict:
+    """Parse one log line, raising ``ValueError``, ``TypeError`` or ``KeyError`` if it is malformed."""
+    import json
+
+    record = json.loads(line)
+    if not isinstance(record['k'], str):
+        raise TypeError('key must be a string')
+
+    if 'track' in record:
+        for limit in record['track']:
+            if limit is not None and (isinstance(limit, bool) or not isinstance(limit, (int, float))):
+                raise TypeError('retention limits must be numbers')
+    elif 'untrack' not in record:
+        record['v'], record['t'] = int(record['v']), float(record['t'])
+        if record['d'] is not None and not isinstance(record['d'], str):
+            raise TypeError('value must be an encoded string')
+    return record
+
+
+def _blob_digest(encoded: str) -> str:
+    if encoded is None or BLOB_MARKER not in encoded:
+        return None
+
+    import json
+    value = json.loads(encoded)
+    return value[BLOB_MARKER] if BlobStore.is_reference(value) else None
+
+
+class VersionHistory:
+    """Append-only per-key history of ``(version, timestamp, value, blob)`` entries.
+
+    File-backed histories keep only the byte offset of each record in memory
+    and read values back from the log on demand; in-memory histories keep the
+    encoded values themselves. A value of ``None`` marks a deletion. Entry
+    lists are only ever appended to in place and are replaced when trimmed,
+    so readers keep a consistent view while writers carry on.
+
+    ``blob_refs`` counts the live entries referencing each blob digest, and
+    digests no entry references any more are queued in ``released``.
+    """
+
+    _COMPACT_MIN_GARBAGE = 1024
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self._entries = {}
+        self._policies = {}
+        self._garbage = 0
+        self._file = None
+        self.blob_refs = {}
+        self.released = []
+
+        if path is not None and os.path.isfile(path):
+            self._load()
+
+    @staticmethod
+    def _line(record: dict) -> bytes:
+        import json
+        return (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+    def _load(self) -> None:
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                start = offset
+                offset += len(line)
+                try:
+                    record = parse_record(line)
+                except (ValueError, TypeError, KeyError):
+                    continue
+
+                key = record['k']
+                if 'track' in record:
+                    max_versions, max_age = record['track']
+                    self._policies[key] = (max_versions, max_age)
+                    self._entries.setdefault(key, [])
+                elif 'untrack' in record:
+                    self._policies.pop(key, None)
+                    self._release(self._entries.pop(key, ()))
+                elif key in self._policies:
+                    ref = None if record['d'] is None else start
+                    digest = _blob_digest(record['d'])
+                    self._hold(digest)
+                    self._entries[key].append((record['v'], record['t'], ref, digest))
+
+        for key in self._entries:
+            self._apply_retention(key, time.time())
+        self.released.clear()
+
+    def _append(self, record: dict) -> int:
+        if self.path is None:
+            return None
+
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+            if self._file.tell():
+                with open(self.path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        self._file.write(b'\n')
+        offset = self._file.tell()
+        self._file.write(self._line(record))
+        self._file.flush()
+        return offset
+
+    def _read(self, ref, file=None):
+        if not isinstance(ref, int):
+            return ref
+
+        import json
+
+        if file is None:
+            with open(self.path, 'rb') as f:
+                f.seek(ref)
+                return json.loads(f.readline())['d']
+        file.seek(ref)
+        return json.loads(file.readline())['d']
+
+    def _hold(self, digest: str) -> None:
+        if digest is not None:
+            self.blob_refs[digest] = self.blob_refs.get(digest, 0) + 1
+
+    def _release(self, entries) -> None:
+        for entry in entries:
+            digest = entry[3]
+            if digest is None:
+                continue
+            count = self.blob_refs.pop(digest) - 1
+            if count:
+                self.blob_refs[digest] = count
+            else:
+                self.released.append(digest)
+
+    def is_tracked(self, key: str) -> bool:
+        return key in self._policies
+
+    def tracked(self) -> list:
+        return sorted(self._policies)
+
+    def track(self, key: str, max_versions: int = None, max_age: float = None) -> None:
+        self._policies[key] = (max_versions, max_age)
+        self._entries.setdefault(key, [])
+        self._append({'k': key, 'track': [max_versions, max_age]})
+        self._apply_retention(key, time.time())
+
+    def untrack(self, key: str) -> None:
+        if key not in self._policies:
+            return
+        del self._policies[key]
+        entries = self._entries.pop(key, ())
+        self._garbage += len(entries)
+        self._release(entries)
+        self._append({'k': key, 'untrack': True})
+
+    def record(self, key: str, encoded: str = None, timestamp: float = None) -> int:
+        if timestamp is None:
+            timestamp = time.time()
+
+        entries = self._entries[key]
+        version = entries[-1][0] + 1 if entries else 1
+        offset = self._append({'k': key, 'v': version, 't': timestamp, 'd': encoded})
+        digest = _blob_digest(encoded)
+        self._hold(digest)
+        entries.append((version, timestamp, encoded if offset is None or encoded is None else offset, digest))
+        self._apply_retention(key, timestamp)
+        return version
+
+    def versions(self, key: str) -> list:
+        return [(entry[0], entry[1]) for entry in self._entries.get(key, ())]
+
+    def encoded_values(self):
+        for entries in list(self._entries.values()):
+            for entry in entries:
+                if entry[2] is not None:
+                    yield self._read(entry[2])
+
+    def get(self, key: str, version: int):
+        entries = self._entries.get(key, ())
+        if not entries:
+            return None
+
+        position = version - entries[0][0]
+        if 0 <= position < len(entries) and entries[position][0] == version:
+            return self._read(entries[position][2])
+
+        for entry in entries:
+            if entry[0] == version:
+                return self._read(entry[2])
+        return None
+
+    def as_of(self, key: str, timestamp: float):
+        entries = self._entries.get(key, ())
+        low, high = 0, len(entries)
+        while low < high:
+            middle = (low + high) // 2
+            if entries[middle][1] <= timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        if low == 0:
+            return None
+        return self._read(entries[low - 1][2])
+
+    def _apply_retention(self, key: str, now: float) -> None:
+        max_versions, max_age = self._policies.get(key, (None, None))
+        entries = self._entries.get(key, [])
+
+        drop = 0
+        if max_versions is not None and len(entries) > max_versions:
+            drop = len(entries) - max_versions
+        if max_age is not None:
+            while drop < len(entries) - 1 and entries[drop][1] < now - max_age:
+                drop += 1
+
+        if drop:
+            self._entries[key] = entries[drop:]
+            self._garbage += drop
+            self._release(entries[:drop])
+            self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self.path is None or self._garbage < self._COMPACT_MIN_GARBAGE:
+            return
+        if self._garbage >= sum(len(entries) for entries in self._entries.values()):
+            self.compact()
+
+    def compact(self) -> None:
+        self._garbage = 0
+        if self.path is None:
+            return
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        temp_path = self.path + '.tmp'
+        compacted = {}
+        with open(self.path, 'rb') as source, open(temp_path, 'wb') as f:
+            for key, (max_versions, max_age) in self._policies.items():
+                f.write(self._line({'k': key, 'track': [max_versions, max_age]}))
+                entries = compacted[key] = []
+                for version, timestamp, ref, digest in self._entries.get(key, ()):
+                    encoded = self._read(ref, source)
+                    offset = f.tell()
+                    f.write(self._line({'k': key, 'v': version, 't': timestamp, 'd': encoded}))
+                    entries.append((version, timestamp, None if encoded is None else offset, digest))
+        os.replace(temp_path, self.path)
+        self._entries = compacted
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,154 @@
+import json
+import os
+import sys
+from array import array
+
+import pytest
+
+from dbase import DataBase
+
+
+def _reload(path: str) -> DataBase:
+    return DataBase(path, show_logs=False)
+
+
+def test_append_persists_tail(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = _reload(path)
+    db.append_array('series', [1.0, 2.0])
+    db.append_array('series', [3.0])
+    db.close()
+
+    assert _reload(path).series == array('d', [1.0, 2.0, 3.0])
+
+
+def test_in_place_edit_is_persisted(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = _reload(path)
+    db.series = array('d', [1.0, 2.0, 3.0])
+    db['series'][0] = 99.0
+    db.other = 1
+    db.close()
+
+    assert _reload(path).series == array('d', [99.0, 2.0, 3.0])
+
+
+def test_edit_and_append_together(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = _reload(path)
+    db.series = array('i', [1, 2, 3])
+    db.series[1] = 20
+    db.append_array('series', [4])
+    db.close()
+
+    assert _reload(path).series == array('i', [1, 20, 3, 4])
+
+
+def test_shrink_is_persisted(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = _reload(path)
+    db.series = array('d', [1.0, 2.0, 3.0])
+    del db.series[1:]
+    db.close()
+
+    assert _reload(path).series == array('d', [1.0])
+
+
+def test_append_empty_typed_array(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = _reload(path)
+    db.append_array('series', array('i'))
+    db.append_array('series', array('i'))
+    db.close()
+
+    series = _reload(path).series
+    assert series.typecode == 'i'
+    assert len(series) == 0
+
+
+def test_foreign_byte_order_is_saved_after_conversion(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = _reload(path)
+    db.series = array('i', [1, 2, 3])
+    db.close()
+
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    payload = data['series']['__dbase_array__']
+    file_path = os.path.join(path + '.arrays', payload['file'])
+    swapped = array('i', [1, 2, 3])
+    swapped.byteswap()
+    with open(file_path, 'wb') as f:
+        swapped.tofile(f)
+    payload['byteorder'] = 'big' if sys.byteorder == 'little' else 'little'
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+    assert _reload(path).series == array('i', [1, 2, 3])
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['series']['__dbase_array__']['byteorder'] == sys.byteorder
+    assert _reload(path).series == array('i', [1, 2, 3])
+
+
+def test_temp_database_spills_on_array_size():
+    db = DataBase(is_temp=True, show_logs=False, spill_size=1024)
+    db.append_array('series', [0.0] * 512)
+    path = db.get_file_path()
+
+    assert path is not None
+    assert os.path.isdir(path + '.arrays')
+    db.close()
+    assert not os.path.exists(path + '.arrays')
+
+
+def test_unrelated_writes_do_not_check_arrays(tmp_path, monkeypatch):
+    from dbase.arrays import ArrayStore
+
+    path = str(tmp_path / 'store.json')
+    db = _reload(path)
+    db.series = array('d', [1.0, 2.0])
+
+    def fail(self, key, values):
+        raise AssertionError('sync called on an unrelated write')
+
+    monkeypatch.setattr(ArrayStore, 'sync', fail)
+    db.counter = 1
+    db.append_array('series', [3.0])
+    monkeypatch.undo()
+    db.close()
+
+    assert _reload(path).series == array('d', [1.0, 2.0, 3.0])
+
+
+def test_flush_persists_in_place_edit(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = _reload(path)
+    db.series = array('d', [1.0, 2.0])
+    db.series[1] = 5.0
+    db.flush()
+
+    assert _reload(path).series == array('d', [1.0, 5.0])
+    db.close()
+
+
+def test_numpy_arrays_are_converted(tmp_path):
+    numpy = pytest.importorskip('numpy')
+
+    path = str(tmp_path / 'store.json')
+    db = _reload(path)
+    db.big = numpy.array([1.5, -2.25], dtype='>f8')
+    db.ints = numpy.arange(4, dtype='<i4')
+    assert db.big == array('d', [1.5, -2.25])
+
+    with pytest.raises(TypeError):
+        db.half = numpy.array([1.0], dtype=numpy.float16)
+    with pytest.raises(TypeError):
+        db.flags = numpy.array([True, False])
+    with pytest.raises(TypeError):
+        db.grid = numpy.zeros((2, 2))
+    db.close()
+
+    db = _reload(path)
+    assert db.keys() == ['big', 'ints']
+    assert list(db.to_numpy('big')) == [1.5, -2.25]
+    assert db.ints == array('i', [0, 1, 2, 3])
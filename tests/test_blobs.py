@@ -0,0 +1,174 @@
+import copy
+import json
+import os
+from array import array
+
+import pytest
+
+from dbase import DataBase
+
+
+def _open_fds() -> int:
+    return len(os.listdir('/proc/self/fd'))
+
+
+def test_blob_survives_reload(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.data = b'\x00\x01binary'
+    db.close()
+
+    db = DataBase(path, show_logs=False)
+    assert isinstance(db.data, memoryview)
+    assert bytes(db.data) == b'\x00\x01binary'
+    assert bytes(db['data']) == b'\x00\x01binary'
+    assert db.keys() == ['data']
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc/self/fd'), reason='needs /proc/self/fd')
+def test_loading_blobs_holds_no_descriptors(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.set_many({f'blob{index}': bytes([index]) * 64 for index in range(50)})
+    db.close()
+
+    before = _open_fds()
+    db = DataBase(path, show_logs=False)
+    assert _open_fds() - before <= 1
+    for index in range(50):
+        assert bytes(db[f'blob{index}']) == bytes([index]) * 64
+    assert _open_fds() - before <= 1
+    db.close()
+
+
+def test_failed_load_refuses_writes(tmp_path, monkeypatch):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.data = b'payload'
+    db.key = 1
+    db.close()
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+
+    def fail(self, name, value):
+        raise OSError(24, 'Too many open files')
+
+    monkeypatch.setattr(DataBase, '_decode_value', fail)
+    db = DataBase(path, show_logs=False)
+    assert db.keys() == []
+    with pytest.raises(RuntimeError):
+        db.other = 2
+    with pytest.raises(RuntimeError):
+        db.prune_blobs()
+    db.close()
+
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == content
+
+
+def test_copy_with_blob_values():
+    db = DataBase(is_temp=True, show_logs=False)
+    db.data = b'abc'
+    db.items_list = [1, 2]
+
+    shallow = copy.copy(db)
+    assert bytes(shallow.data) == b'abc'
+    assert shallow.items_list == [1, 2]
+
+
+def test_put_normalises_buffers():
+    db = DataBase(is_temp=True, show_logs=False)
+    db.strided = memoryview(b'abcdef')[::2]
+    db.typed = memoryview(array('i', [1, 2, 3]))
+
+    assert bytes(db.strided) == b'ace'
+    assert db.typed.format == 'B'
+    assert len(db.typed) == 3 * array('i').itemsize
+
+
+def test_temp_database_spills_on_blob_size():
+    db = DataBase(is_temp=True, show_logs=False, spill_size=1024)
+    db.data = b'x' * 4096
+    path = db.get_file_path()
+
+    assert path is not None
+    assert os.path.isdir(path + '.blobs')
+    assert bytes(db.data) == b'x' * 4096
+    db.close()
+    assert not os.path.exists(path + '.blobs')
+
+
+def test_marker_shaped_user_dicts_round_trip(tmp_path):
+    path = str(tmp_path / 'store.json')
+    values = {
+        'blob_like': {'__dbase_blob__': 'not-a-digest'},
+        'array_like': {'__dbase_array__': {'typecode': 'd', 'items': [1.0]}},
+        'escape_like': {'__dbase_escape__': 5},
+    }
+    db = DataBase(path, show_logs=False)
+    db.set_many(values)
+    db.close()
+
+    db = DataBase(path, show_logs=False)
+    assert dict(db.items()) == values
+
+
+def test_missing_blob_reference_is_preserved(tmp_path):
+    path = str(tmp_path / 'store.json')
+    reference = {'__dbase_blob__': '0' * 64}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'data': reference, 'key': 1}, f)
+
+    db = DataBase(path, show_logs=False)
+    assert db.data == reference
+    db.key = 2
+    db.close()
+
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['data'] == reference
+
+
+def test_overwritten_blobs_are_released_in_memory():
+    db = DataBase(is_temp=True, show_logs=False)
+    for number in range(100):
+        db.data = os.urandom(1000) + bytes([number])
+    db.other = b'kept'
+    del db.other
+
+    assert len(db._blobs.digests()) == 1
+
+
+def test_overwritten_blobs_are_removed_from_disk(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.first = b'shared'
+    db.second = b'shared'
+    for number in range(10):
+        db.data = bytes([number]) * 16
+    assert len(os.listdir(path + '.blobs')) == 2
+
+    del db.first
+    assert bytes(db.second) == b'shared'
+    del db.second
+    db.data = 'text'
+    assert os.listdir(path + '.blobs') == []
+
+
+def test_blobs_held_by_version_history(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.track_versions('data', max_versions=2)
+    for number in range(5):
+        db.data = bytes([number]) * 16
+    assert len(os.listdir(path + '.blobs')) == 2
+    db.close()
+
+    db = DataBase(path, show_logs=False)
+    assert bytes(db.get('data', version=4)) == bytes([3]) * 16
+    db.data = b'new'
+    assert len(os.listdir(path + '.blobs')) == 2
+    assert bytes(db.get('data', version=5)) == bytes([4]) * 16
+
+    db.untrack_versions('data')
+    assert len(os.listdir(path + '.blobs')) == 1
+    assert bytes(db.data) == b'new'
@@ -0,0 +1,96 @@
+import json
+import os
+import stat
+
+from dbase import DataBase
+from dbase.__main__ import main
+
+
+def _store(tmp_path, data: dict = None) -> str:
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.set_many(data or {'a': 1, 'b': [1, 2, 3]})
+    db.close()
+    return path
+
+
+def test_compact_preserves_mode(tmp_path):
+    path = _store(tmp_path)
+    os.chmod(path, 0o644)
+
+    assert main(['compact', path]) == 0
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'a': 1, 'b': [1, 2, 3]}
+
+
+def test_convert_copies_source_mode(tmp_path):
+    path = _store(tmp_path)
+    os.chmod(path, 0o640)
+    target = str(tmp_path / 'copy.json')
+
+    assert main(['convert', path, target, '--indent', '2']) == 0
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o640
+
+
+def test_invalid_utf8_is_reported(tmp_path, capsys):
+    path = tmp_path / 'store.json'
+    path.write_bytes(b'{"a": "\xff\xfe"}')
+
+    for command in (['stats', str(path)], ['compact', str(path)],
+                    ['convert', str(path), str(tmp_path / 'out.json')]):
+        assert main(command) == 1
+        assert 'invalid UTF-8' in capsys.readouterr().err
+    assert main(['verify', str(path)]) == 1
+    assert path.read_bytes() == b'{"a": "\xff\xfe"}'
+    assert sorted(os.listdir(tmp_path)) == ['store.json']
+
+
+def test_verify_accepts_version_marker(tmp_path, capsys):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.track_versions('a')
+    db.a = 1
+    db.close()
+
+    assert main(['verify', path]) == 0
+    assert 'WARNING' not in capsys.readouterr().out
+
+
+def test_verify_warns_about_incomplete_version_lines(tmp_path, capsys):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.track_versions('a')
+    db.a = 1
+    db.close()
+    with open(path + '.versions', 'a', encoding='utf-8') as f:
+        f.write('{"k":"a","v":2}\n')
+
+    assert main(['verify', path]) == 0
+    assert 'version log line 3 is unreadable' in capsys.readouterr().out
+
+
+def test_convert_refuses_same_file(tmp_path, capsys):
+    path = _store(tmp_path)
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    assert main(['convert', path, path, '--force']) == 1
+    assert main(['convert', path, str(tmp_path / '.' / 'store.json'), '--force']) == 1
+    assert 'is the source store' in capsys.readouterr().err
+    with open(path, 'rb') as f:
+        assert f.read() == content
+
+
+def test_convert_force_clears_stale_sidecars(tmp_path):
+    path = _store(tmp_path, {'data': b'payload'})
+    target = str(tmp_path / 'copy.json')
+    stale = DataBase(target, show_logs=False)
+    stale.old = b'stale blob'
+    stale.track_versions('old')
+    stale.close()
+
+    assert main(['convert', path, target, '--force']) == 0
+    assert len(os.listdir(target + '.blobs')) == 1
+    assert not os.path.exists(target + '.versions')
+    assert bytes(DataBase(target, show_logs=False).data) == b'payload'
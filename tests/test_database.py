@@ -0,0 +1,62 @@
+import json
+import os
+
+from dbase import DataBase
+
+
+def test_temp_database_creates_no_file():
+    db = DataBase(is_temp=True, show_logs=False)
+    db.key = 'value'
+
+    assert db.get_file() is None
+    assert db.get_file_path() is None
+    assert db.key == 'value'
+
+
+def test_temp_database_spills_and_removes_file():
+    db = DataBase(is_temp=True, show_logs=False, spill_size=16)
+    db.key = 'x' * 32
+    path = db.get_file_path()
+
+    assert path is not None and os.path.isfile(path)
+    db.close()
+    assert not os.path.exists(path)
+
+
+def test_context_manager_with_key_named_close(tmp_path):
+    path = tmp_path / 'store.json'
+    path.write_text(json.dumps({'close': 1}), encoding='utf-8')
+
+    with DataBase(str(path), show_logs=False) as db:
+        db.other = 2
+
+    assert json.loads(path.read_text(encoding='utf-8')) == {'close': 1, 'other': 2}
+
+
+def test_sorted_index_scan_and_range(tmp_path):
+    db = DataBase(str(tmp_path / 'store.json'), show_logs=False)
+    db.set_many({'user:2': 2, 'user:1': 1, 'post:1': 'p', 'zeta': 0})
+
+    assert db.keys() == ['post:1', 'user:1', 'user:2', 'zeta']
+    assert db.scan('user:') == ['user:1', 'user:2']
+    assert db.range('post:', 'user:2') == ['post:1', 'user:1']
+    assert db.get_many(['user:1', 'missing'], 'd') == {'user:1': 1, 'missing': 'd'}
+
+    db.delete_many(['user:1', 'user:2'])
+    assert 'user:1' not in db
+    db.clear()
+    assert json.loads((tmp_path / 'store.json').read_text(encoding='utf-8')) == {}
+
+
+def test_bulk_paths_with_keys_shadowing_methods(tmp_path):
+    path = tmp_path / 'store.json'
+    path.write_text(json.dumps({'set_many': 1, 'delete_many': 2, 'keys': 3, 'items': 4}), encoding='utf-8')
+    db = DataBase(str(path), show_logs=False)
+
+    db.update(extra=5)
+    assert DataBase.get(db, 'extra') == 5
+    assert db == {'set_many': 1, 'delete_many': 2, 'keys': 3, 'items': 4, 'extra': 5}
+    assert 'extra' in repr(db)
+
+    db.clear()
+    assert len(db) == 0
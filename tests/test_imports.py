@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+from dbase import DataBase
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _loaded_after(code: str, modules: tuple) -> list:
+    script = f"import sys\n{code}\nprint(' '.join(m for m in {modules!r} if m in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.run([sys.executable, '-c', script], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return output.split()
+
+
+def test_import_is_lazy():
+    heavy = ('json', 'tempfile', 'dbase.logger', 'shutil', 'weakref', 'array')
+    assert _loaded_after('import dbase', heavy) == []
+
+
+def test_temp_database_does_not_load_logger():
+    code = 'from dbase import DataBase\ndb = DataBase(is_temp=True)\ndb.key = 1'
+    assert _loaded_after(code, ('dbase.logger', 'tempfile')) == []
+
+
+def test_instances_share_logger():
+    first = DataBase(is_temp=True, show_logs=False)
+    second = DataBase(is_temp=True, show_logs=False)
+
+    assert first.logger is second.logger
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from dbase import DataBase
+
+
+def test_open_shares_instance(tmp_path):
+    path = str(tmp_path / 'store.json')
+    first = DataBase.open(path, show_logs=False)
+    second = DataBase.open(str(tmp_path / '.' / 'store.json'))
+
+    assert first is second
+    first.close()
+    assert not first._closed
+    second.close()
+    assert first._closed
+
+
+def test_open_rejects_conflicting_show_logs(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = DataBase.open(path, show_logs=False)
+
+    with pytest.raises(ValueError):
+        DataBase.open(path, show_logs=True)
+    assert DataBase.open(path, show_logs=False) is db
+    db.close()
+    db.close()
+
+
+def test_slow_open_does_not_block_other_paths(tmp_path, monkeypatch):
+    slow_path = str(tmp_path / 'slow.json')
+    fast_path = str(tmp_path / 'fast.json')
+    started = threading.Event()
+    release = threading.Event()
+    check = DataBase._data_compliance_check
+
+    def slow_check(self):
+        if self._file_path == slow_path:
+            started.set()
+            release.wait(5)
+        check(self)
+
+    monkeypatch.setattr(DataBase, '_data_compliance_check', slow_check)
+    opened = []
+    threads = [threading.Thread(target=lambda: opened.append(DataBase.open(slow_path, show_logs=False)))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+
+    fast = DataBase.open(fast_path, show_logs=False)
+    assert not release.is_set()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(opened) == 2 and opened[0] is opened[1]
+    fast.close()
+    opened[0].close()
+    opened[0].close()
+
+
+def test_failed_open_releases_path_lock(tmp_path):
+    from dbase import _opening_locks
+
+    path = str(tmp_path / 'missing' / 'store.json')
+    with pytest.raises(OSError):
+        DataBase.open(path, show_logs=False)
+    assert _opening_locks == {}
+
+    (tmp_path / 'missing').mkdir()
+    db = DataBase.open(path, show_logs=False)
+    assert _opening_locks == {}
+    db.close()
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from dbase.stream import StreamError, iter_items
+
+
+DATA = {
+    'number': 1.5e+10,
+    'negative': -12345678,
+    'text': 'line "quoted" é中' * 5,
+    'nested': {'list': [1, 2.25, None, True, {'deep': 'value'}]},
+    'empty': {},
+    'flag': False,
+}
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 20])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_items_across_chunk_boundaries(tmp_path, chunk_size, indent):
+    path = tmp_path / 'store.json'
+    path.write_text(json.dumps(DATA, indent=indent, ensure_ascii=False), encoding='utf-8')
+
+    items = list(iter_items(str(path), chunk_size))
+
+    assert {key: value for key, value, _ in items} == DATA
+    assert [key for key, _, _ in items] == list(DATA)
+
+
+def test_reported_sizes_match_encoding(tmp_path):
+    path = tmp_path / 'store.json'
+    path.write_text('{"a": [1, 2], "b": "xyz"}', encoding='utf-8')
+
+    assert [(key, size) for key, _, size in iter_items(str(path), 2)] == [('a', 6), ('b', 5)]
+
+
+def test_empty_file_and_object(tmp_path):
+    path = tmp_path / 'store.json'
+    path.write_text('', encoding='utf-8')
+    assert list(iter_items(str(path))) == []
+
+    path.write_text(' {} ', encoding='utf-8')
+    assert list(iter_items(str(path))) == []
+
+
+@pytest.mark.parametrize('content', ['{"a": 1', '{"a" 1}', '{"a": 1} x', '[1]', '{1: 2}', '{"a": 1.}'])
+def test_malformed_input_raises(tmp_path, content):
+    path = tmp_path / 'store.json'
+    path.write_text(content, encoding='utf-8')
+
+    with pytest.raises(StreamError):
+        list(iter_items(str(path), 2))
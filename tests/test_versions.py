@@ -0,0 +1,107 @@
+import json
+import time
+
+from dbase import DataBase
+
+
+def test_retention_by_count(tmp_path):
+    db = DataBase(str(tmp_path / 'store.json'), show_logs=False)
+    db.track_versions('price', max_versions=3)
+    for price in range(10):
+        db.price = price
+
+    assert [version for version, _ in db.versions('price')] == [8, 9, 10]
+    assert db.get('price', version=8) == 7
+    assert db.get('price', version=1, default='gone') == 'gone'
+
+
+def test_history_survives_reload(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.track_versions('price')
+    db.price = 10
+    checkpoint = time.time()
+    db.price = 12
+    db.close()
+
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['__dbase_versions__'] is True
+
+    db = DataBase(path, show_logs=False)
+    assert db.price == 12
+    assert db.get('price', version=1) == 10
+    assert db.as_of(checkpoint) == {'price': 10}
+    assert list(db.keys()) == ['price']
+
+
+def test_store_without_history_skips_log(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.key = 1
+    db.close()
+
+    db = DataBase(path, show_logs=False)
+    assert db._versions is None
+    assert list(db.keys()) == ['key']
+
+
+def test_untrack_clears_marker(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.track_versions('price')
+    db.price = 1
+    db.untrack_versions('price')
+    db.close()
+
+    with open(path, encoding='utf-8') as f:
+        assert '__dbase_versions__' not in json.load(f)
+
+
+def test_unserializable_value_records_empty_version(tmp_path):
+    db = DataBase(str(tmp_path / 'store.json'), show_logs=False)
+    db.track_versions('value')
+    db.value = 1
+    checkpoint = time.time()
+    db.value = {1, 2}
+
+    assert [version for version, _ in db.versions('value')] == [1, 2]
+    assert db.get('value', version=1) == 1
+    assert db.get('value', version=2, default='missing') == 'missing'
+    assert db.as_of(time.time()) == {}
+    assert db.as_of(checkpoint) == {'value': 1}
+
+
+def test_incomplete_log_lines_are_skipped(tmp_path):
+    path = str(tmp_path / 'store.json')
+    db = DataBase(path, show_logs=False)
+    db.track_versions('a')
+    db.a = 1
+    db.close()
+
+    with open(path + '.versions', 'a', encoding='utf-8') as f:
+        f.write('{"k":"a","v":2}\n{"k":"a","track":"x"}\n{"k":"a","v":3,"t":"soon","d":"3"}\n[1]\n{"k":"a","v":4,"t":1')
+
+    db = DataBase(path, show_logs=False)
+    assert not db._load_failed
+    assert db.a == 1
+    assert [version for version, _ in db.versions('a')] == [1]
+    db.a = 2
+    db.close()
+
+    db = DataBase(path, show_logs=False)
+    assert [version for version, _ in db.versions('a')] == [1, 2]
+    assert db.get('a', version=2) == 2
+
+
+def test_file_history_keeps_offsets_not_values(tmp_path, monkeypatch):
+    from dbase.versions import VersionHistory
+
+    monkeypatch.setattr(VersionHistory, '_COMPACT_MIN_GARBAGE', 4)
+    db = DataBase(str(tmp_path / 'store.json'), show_logs=False)
+    db.track_versions('doc', max_versions=3)
+    for number in range(20):
+        db.doc = {'number': number, 'payload': 'x' * 100}
+
+    entries = db._versions._entries['doc']
+    assert all(isinstance(entry[2], int) for entry in entries)
+    assert [db.get('doc', version=version)['number'] for version, _ in db.versions('doc')] == [17, 18, 19]